@@ -7,19 +7,43 @@ Usage:
     python optimize_images.py                    # Process all armies (with confirmation)
     python optimize_images.py --army tribal     # Process only the tribal army
     python optimize_images.py --army sci_fi     # Process only the sci-fi army
+    python optimize_images.py --responsive      # 1x/2x/3x variants per display slot + manifest
     
 This will create optimized versions in subdirectories:
 - 64x64/ (for game board pieces)
 - 128x128/ (for UI elements)
 - 256x256/ (for future use/zoom)
+
+With --responsive, sizes are derived from the CSS size of each display slot
+(board, viewer, combat) multiplied by each device pixel ratio, and an
+image_manifest.json is written per army with ready-made srcset strings and a
+tiny blurred base64 placeholder (LQIP) for every image.
 """
 
 import os
+import re
 import sys
+import io
+import json
+import base64
 from pathlib import Path
-from PIL import Image, ImageOps
+from PIL import Image, ImageOps, ImageFilter
 import argparse
 
+# CSS pixel size at which each display slot renders a piece image.
+DISPLAY_SLOTS = {
+    "board": 84,    # GameSquare.jsx PieceImage
+    "viewer": 128,  # UnitViewer.jsx UnitImageContainer
+    "combat": 256,  # CombatModal.jsx UnitImage
+}
+
+DEFAULT_DENSITIES = (1, 2, 3)
+
+MANIFEST_NAME = "image_manifest.json"
+
+# A "placeholder" line previously written by embed_placeholders.
+PLACEHOLDER_LINE = re.compile(r'^\s*"placeholder"\s*:\s*"data:[^"]*",\s*$')
+
 def ensure_pillow():
     """Check if Pillow is installed, provide installation instructions if not."""
     try:
@@ -67,6 +91,203 @@ def optimize_image(input_path, output_path, target_size, quality=85):
         print(f"❌ Error processing {input_path}: {e}")
         return False
 
+def make_placeholder(input_path, lqip_size=16, blur_radius=1):
+    """
+    Build a tiny blurred placeholder (LQIP) for an image as a data URI.
+    
+    Args:
+        input_path (Path): Source image file
+        lqip_size (int): Width/height of the placeholder in pixels
+        blur_radius (int): Gaussian blur radius applied after downscaling
+    
+    Returns:
+        str: data:image/png;base64,... URI, or None on failure
+    """
+    try:
+        with Image.open(input_path) as img:
+            if img.mode not in ('RGB', 'RGBA'):
+                img = img.convert('RGBA')
+            tiny = img.resize((lqip_size, lqip_size), Image.Resampling.LANCZOS)
+            if blur_radius > 0:
+                tiny = tiny.filter(ImageFilter.GaussianBlur(blur_radius))
+            buffer = io.BytesIO()
+            tiny.save(buffer, 'PNG', optimize=True)
+            encoded = base64.b64encode(buffer.getvalue()).decode('ascii')
+            return f"data:image/png;base64,{encoded}"
+    except Exception as e:
+        print(f"❌ Error building placeholder for {input_path}: {e}")
+        return None
+
+def build_responsive_sizes(slots, densities):
+    """
+    Expand display slots and pixel densities into a size dictionary.
+    
+    Slots that resolve to the same pixel size share one output directory,
+    so e.g. viewer@2x and combat@1x are both served from 256x256/.
+    
+    Args:
+        slots (dict): Dictionary of slot_name -> CSS pixel size
+        densities (iterable): Device pixel ratios (e.g. 1, 2, 3)
+    
+    Returns:
+        dict: size_name -> (width, height), sorted by pixel size
+    """
+    pixel_sizes = {css_size * density for css_size in slots.values() for density in densities}
+    return {f"{px}x{px}": (px, px) for px in sorted(pixel_sizes)}
+
+def build_placeholders(army_path, lqip_size=16):
+    """
+    Build placeholders for every top-level PNG in an army directory.
+    
+    Args:
+        army_path (Path): Path to army directory
+        lqip_size (int): Width/height of the inline placeholders
+    
+    Returns:
+        dict: piece_id -> placeholder data URI
+    """
+    placeholders = {}
+    for png_file in sorted(f for f in army_path.glob("*.png") if f.is_file()):
+        placeholder = make_placeholder(png_file, lqip_size)
+        if placeholder:
+            placeholders[png_file.stem] = placeholder
+    return placeholders
+
+def write_image_manifest(army_path, slots, densities, written, placeholders, output_format='png'):
+    """
+    Write image_manifest.json with srcset strings and placeholders for an army.
+    
+    Only variants that were actually generated are listed, so a failed resize
+    never ends up in a srcset. Entries are merged into an existing manifest
+    built with the same slots and densities, so re-running on a directory
+    holding only some source images keeps the other pieces.
+    
+    Args:
+        army_path (Path): Path to army directory
+        slots (dict): Dictionary of slot_name -> CSS pixel size
+        densities (iterable): Device pixel ratios used for the variants
+        written (dict): piece_id -> set of size names generated for it
+        placeholders (dict): piece_id -> placeholder data URI
+        output_format (str): Output format of the generated variants
+    """
+    url_base = f"/data/armies/{army_path.name}"
+    
+    pieces = {}
+    for piece_id in sorted(written):
+        entry = {"src": {}, "srcset": {}}
+        for slot_name, css_size in slots.items():
+            urls = []
+            for density in densities:
+                px = css_size * density
+                if f"{px}x{px}" in written[piece_id]:
+                    urls.append((density, f"{url_base}/{px}x{px}/{piece_id}.{output_format}"))
+            if urls:
+                # Lowest available density is the fallback src (1x unless it was left out or failed)
+                entry["src"][slot_name] = urls[0][1]
+                entry["srcset"][slot_name] = ", ".join(f"{url} {density}x" for density, url in urls)
+        
+        if piece_id in placeholders:
+            entry["placeholder"] = placeholders[piece_id]
+        pieces[piece_id] = entry
+    
+    manifest = {
+        "army": army_path.name,
+        "slots": {name: {"size": size} for name, size in slots.items()},
+        "densities": list(densities),
+        "pieces": {},
+    }
+    manifest_path = army_path / MANIFEST_NAME
+    if manifest_path.exists():
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                existing = json.load(f)
+            if (existing.get("slots") == manifest["slots"]
+                    and existing.get("densities") == manifest["densities"]
+                    and isinstance(existing.get("pieces"), dict)):
+                manifest["pieces"] = existing["pieces"]
+        except (OSError, ValueError) as e:
+            print(f"   ⚠️  Ignoring unreadable {MANIFEST_NAME}: {e}")
+    manifest["pieces"].update(pieces)
+    manifest["pieces"] = dict(sorted(manifest["pieces"].items()))
+    
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    print(f"   🗂️  Wrote {MANIFEST_NAME} ({len(pieces)} updated, {len(manifest['pieces'])} total)")
+
+def embed_placeholders(army_path, placeholders):
+    """
+    Embed placeholders into the army roster JSON as a per-piece "placeholder" field.
+    
+    Rosters are edited by hand, so the file is not re-serialized: a
+    "placeholder" line is inserted (or replaced) directly under each piece's
+    key and every other line is left untouched. The result is parsed back and
+    only written if it matches the original roster plus the placeholders.
+    
+    Args:
+        army_path (Path): Path to army directory
+        placeholders (dict): piece_id -> placeholder data URI
+    """
+    roster_path = army_path / f"{army_path.name}.json"
+    if not roster_path.exists():
+        print(f"   ⚠️  No roster found at {roster_path}, skipping placeholder embedding")
+        return
+    
+    with open(roster_path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    roster = json.loads(text)
+    
+    pieces = roster.get('pieces')
+    if not isinstance(pieces, dict):
+        print(f"   ⚠️  {roster_path.name} has no pieces object, skipping placeholder embedding")
+        return
+    
+    lines = text.splitlines(keepends=True)
+    embedded = 0
+    for piece_id, piece in pieces.items():
+        placeholder = placeholders.get(piece_id)
+        if not placeholder or not isinstance(piece, dict):
+            continue
+        key_pattern = re.compile(r'^\s*' + re.escape(json.dumps(piece_id)) + r'\s*:\s*\{\s*$')
+        key_line = next((i for i, line in enumerate(lines) if key_pattern.match(line)), None)
+        if key_line is None or key_line + 1 >= len(lines):
+            print(f"   ⚠️  Could not locate '{piece_id}' in {roster_path.name}, skipping")
+            continue
+        
+        next_line = lines[key_line + 1]
+        indent = next_line[:len(next_line) - len(next_line.lstrip())]
+        placeholder_line = f'{indent}"placeholder": {json.dumps(placeholder)},\n'
+        if PLACEHOLDER_LINE.match(next_line):
+            lines[key_line + 1] = placeholder_line
+        else:
+            lines.insert(key_line + 1, placeholder_line)
+        piece['placeholder'] = placeholder
+        embedded += 1
+    
+    updated_text = ''.join(lines)
+    try:
+        updated = json.loads(updated_text)
+    except ValueError as e:
+        print(f"   ❌ Embedding would break {roster_path.name} ({e}), leaving it unchanged")
+        return
+    if updated != roster:
+        print(f"   ❌ Embedding did not round-trip for {roster_path.name}, leaving it unchanged")
+        return
+    
+    with open(roster_path, 'w', encoding='utf-8') as f:
+        f.write(updated_text)
+    print(f"   🧩 Embedded {embedded} placeholders into {roster_path.name}")
+
+def parse_slots(spec):
+    """Parse a slot specification like 'board:84,viewer:128' into a dict."""
+    slots = {}
+    for slot_spec in spec.split(','):
+        name, size = slot_spec.split(':')
+        size = int(size)
+        if size <= 0:
+            raise ValueError(f"slot size must be positive: {slot_spec}")
+        slots[name.strip()] = size
+    return slots
+
 def get_file_size_mb(file_path):
     """Get file size in MB."""
     return file_path.stat().st_size / (1024 * 1024)
@@ -80,6 +301,9 @@ def process_army_directory(army_path, sizes, keep_original=True, output_format='
         sizes (dict): Dictionary of size_name -> (width, height)
         keep_original (bool): Whether to keep original 1024x1024 images
         output_format (str): Output format ('png' or 'jpg')
+    
+    Returns:
+        dict: image stem -> set of size names successfully written
     """
     print(f"\n🎮 Processing {army_path.name} army...")
     
@@ -88,7 +312,7 @@ def process_army_directory(army_path, sizes, keep_original=True, output_format='
     
     if not png_files:
         print(f"   ⚠️  No PNG files found in {army_path}")
-        return
+        return {}
     
     print(f"   📁 Found {len(png_files)} images")
     
@@ -103,6 +327,7 @@ def process_army_directory(army_path, sizes, keep_original=True, output_format='
     total_original_size = 0
     total_optimized_size = 0
     successful_conversions = 0
+    written = {}
     
     for png_file in png_files:
         original_size = get_file_size_mb(png_file)
@@ -120,6 +345,7 @@ def process_army_directory(army_path, sizes, keep_original=True, output_format='
             if optimize_image(png_file, output_path, (width, height)):
                 optimized_size = get_file_size_mb(output_path)
                 file_optimized_size += optimized_size
+                written.setdefault(png_file.stem, set()).add(size_name)
                 print(f"      ✅ {size_name}: {optimized_size:.1f}MB")
             else:
                 file_success = False
@@ -141,6 +367,7 @@ def process_army_directory(army_path, sizes, keep_original=True, output_format='
     compression_ratio = (1 - total_optimized_size / total_original_size) * 100 if total_original_size > 0 else 0
     print(f"   📊 Summary: {successful_conversions}/{len(png_files)} images processed")
     print(f"   💾 Size reduction: {total_original_size:.1f}MB → {total_optimized_size:.1f}MB ({compression_ratio:.1f}% smaller)")
+    return written
 
 def main():
     parser = argparse.ArgumentParser(description="Optimize Epoch Battles army images")
@@ -152,10 +379,23 @@ def main():
                        help="Keep original 1024x1024 images (default: True)")
     parser.add_argument("--format", choices=['png', 'jpg'], default='png',
                        help="Output format (default: png)")
-    parser.add_argument("--custom-sizes", type=str, 
+    size_mode = parser.add_mutually_exclusive_group()
+    size_mode.add_argument("--custom-sizes", type=str, 
                        help="Custom sizes as 'name1:WxH,name2:WxH' (e.g., 'small:32x32,large:512x512')")
+    size_mode.add_argument("--responsive", action="store_true",
+                       help="Generate DPR variants per display slot and write image_manifest.json")
+    parser.add_argument("--slots", type=str,
+                       help="Display slots as 'name:css_px,...' (default: board:84,viewer:128,combat:256)")
+    parser.add_argument("--densities", type=str, default="1,2,3",
+                       help="Device pixel ratios for --responsive (default: 1,2,3)")
+    parser.add_argument("--lqip-size", type=int, default=16,
+                       help="Width/height of inline placeholders in pixels (default: 16)")
+    parser.add_argument("--embed-placeholders", action="store_true",
+                       help="With --responsive, also embed placeholders into each army roster JSON")
     
     args = parser.parse_args()
+    if args.embed_placeholders and not args.responsive:
+        parser.error("--embed-placeholders requires --responsive")
     
     # Check dependencies
     if not ensure_pillow():
@@ -181,6 +421,21 @@ def main():
                 sys.exit(1)
         sizes = custom_sizes
     
+    # Derive sizes from display slots and pixel densities
+    slots = dict(DISPLAY_SLOTS)
+    densities = DEFAULT_DENSITIES
+    if args.responsive:
+        try:
+            if args.slots:
+                slots = parse_slots(args.slots)
+            densities = tuple(sorted({int(d) for d in args.densities.split(',')}))
+            if densities[0] <= 0:
+                raise ValueError(f"densities must be positive: {args.densities}")
+        except ValueError as e:
+            print(f"❌ Invalid slot or density specification: {e}")
+            sys.exit(1)
+        sizes = build_responsive_sizes(slots, densities)
+    
     # Find armies directory
     armies_path = Path(args.armies_path)
     if not armies_path.exists():
@@ -194,6 +449,9 @@ def main():
     print(f"🎨 Output format: {args.format}")
     print(f"📏 Target sizes: {', '.join(f'{name} ({w}x{h})' for name, (w, h) in sizes.items())}")
     print(f"💾 Keep originals: {args.keep_originals}")
+    if args.responsive:
+        print(f"📱 Display slots: {', '.join(f'{name} ({size}px)' for name, size in slots.items())}")
+        print(f"🔍 Densities: {', '.join(f'{d}x' for d in densities)}")
     
     # Determine which armies to process
     if args.army:
@@ -227,7 +485,18 @@ def main():
     total_start_time = Path().resolve()  # Just for timing reference
     
     for army_dir in sorted(army_dirs):
-        process_army_directory(army_dir, sizes, args.keep_originals, args.format)
+        # Placeholders are built first: they come from the originals, which
+        # may be moved aside by process_army_directory
+        placeholders = build_placeholders(army_dir, args.lqip_size) if args.responsive else {}
+        written = process_army_directory(army_dir, sizes, args.keep_originals, args.format)
+        if args.responsive:
+            if not written:
+                # Keep any existing manifest rather than replacing it with an empty one
+                print(f"   ⚠️  No variants generated, leaving {MANIFEST_NAME} unchanged")
+                continue
+            write_image_manifest(army_dir, slots, densities, written, placeholders, args.format)
+            if args.embed_placeholders:
+                embed_placeholders(army_dir, placeholders)
     
     print("\n🎉 Optimization complete!")
     print("\n💡 Next steps:")
@@ -235,6 +504,8 @@ def main():
     print("   2. Consider using 64x64 for game board pieces")
     print("   3. Use 128x128 for UI elements and piece selection")
     print("   4. Test loading performance in your browser")
+    if args.responsive:
+        print(f"   5. Use srcset and placeholder from each army's {MANIFEST_NAME}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,704 @@
+#!/usr/bin/env python3
+"""
+Validate Epoch Battles game data (armies, maps, terrain, abilities, combat rules).
+
+Each schema is compiled once into a nested set of plain Python closures, then
+every data file is loaded concurrently (a thread pool overlaps the file reads)
+and checked against its schema. After the per-file schema pass, cross-file
+references are checked:
+
+  - every ability referenced by a piece exists in abilities.json, and its
+    parameters are declared there and within min/max
+  - every map terrain (default and overrides) exists in terrain.json
+  - override coordinates and setup rows lie on the board
+  - every army fits every map's numStartingPositions on both sides, after the
+    scout reduction applied by the server for impassable setup tiles
+
+All errors are reported with their file and JSON path, e.g.
+  armies/fantasy/fantasy.json: $.pieces.archmage.abilities[0].id: unknown ability 'recon2'
+
+Usage:
+  python3 validate_data.py [--data-dir PATH] [--combat-file FILE] [--workers N]
+
+Defaults:
+  --data-dir    client/public/data
+  --combat-file server/src/data/combat.json
+
+Exits with status 1 if any error is found, so it can gate the asset pipeline.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from analyze_army_abilities import load_army_files
+
+# A compiled validator appends (json_path, message) tuples to the error list.
+Validator = Callable[[Any, str, List[Tuple[str, str]]], None]
+
+
+# ---------------------------------------------------------------------------
+# Schemas (a small JSON Schema subset)
+# ---------------------------------------------------------------------------
+
+STRING = {'type': 'string'}
+BOOLEAN = {'type': 'boolean'}
+INTEGER = {'type': 'integer'}
+STRING_LIST = {'type': 'array', 'items': STRING}
+
+ABILITY_REF_SCHEMA = {
+    'anyOf': [
+        STRING,
+        {
+            'type': 'object',
+            'required': ['id'],
+            'properties': {'id': STRING},
+            'additionalProperties': INTEGER,
+        },
+    ]
+}
+
+PIECE_SCHEMA = {
+    'type': 'object',
+    'required': ['id', 'name', 'rank', 'count', 'moveable', 'canAttack', 'description', 'class'],
+    'properties': {
+        'id': STRING,
+        'name': STRING,
+        'rank': {'type': ['integer', 'null'], 'minimum': 1},
+        'count': {'type': 'integer', 'minimum': 0},
+        'moveable': BOOLEAN,
+        'canAttack': BOOLEAN,
+        'special': {'type': ['string', 'null']},
+        'symbol': STRING,
+        'description': STRING,
+        'class': STRING,
+        'abilities': {'type': 'array', 'items': ABILITY_REF_SCHEMA},
+        'placeholder': STRING,
+    },
+    'additionalProperties': False,
+}
+
+ARMY_SCHEMA = {
+    'type': 'object',
+    'required': ['id', 'name', 'pieces'],
+    'properties': {
+        'id': STRING,
+        'name': STRING,
+        'description': STRING,
+        'theme': STRING,
+        'totalPieces': {'type': 'integer', 'minimum': 0},
+        'pieces': {'type': 'object', 'additionalProperties': PIECE_SCHEMA},
+    },
+    'additionalProperties': False,
+}
+
+COORD_SCHEMA = {
+    'type': 'object',
+    'required': ['x', 'y'],
+    'properties': {
+        'x': {'type': 'integer', 'minimum': 0},
+        'y': {'type': 'integer', 'minimum': 0},
+    },
+    'additionalProperties': False,
+}
+
+ROW_LIST = {'type': 'array', 'items': {'type': 'integer', 'minimum': 0}}
+
+MAP_SCHEMA = {
+    'type': 'object',
+    'required': ['id', 'name', 'boardSize', 'setupRows', 'defaultTerrain', 'numStartingPositions'],
+    'properties': {
+        'id': STRING,
+        'name': STRING,
+        'description': STRING,
+        'boardSize': {
+            'type': 'object',
+            'required': ['width', 'height'],
+            'properties': {
+                'width': {'type': 'integer', 'minimum': 1},
+                'height': {'type': 'integer', 'minimum': 1},
+            },
+            'additionalProperties': False,
+        },
+        'setupRows': {
+            'type': 'object',
+            'required': ['home', 'away'],
+            'properties': {'home': ROW_LIST, 'away': ROW_LIST},
+            'additionalProperties': False,
+        },
+        'defaultTerrain': STRING,
+        'terrainOverrides': {
+            'type': 'object',
+            'additionalProperties': {'type': 'array', 'items': COORD_SCHEMA},
+        },
+        'theme': STRING,
+        'difficulty': {'enum': ['easy', 'standard', 'medium', 'hard']},
+        'numStartingPositions': {'type': 'integer', 'minimum': 1},
+    },
+    'additionalProperties': False,
+}
+
+TERRAIN_SCHEMA = {
+    'type': 'object',
+    'required': ['terrainTypes'],
+    'properties': {
+        'terrainTypes': {
+            'type': 'object',
+            'additionalProperties': {
+                'type': 'object',
+                'required': ['id', 'name', 'passable'],
+                'properties': {
+                    'id': STRING,
+                    'name': STRING,
+                    'description': STRING,
+                    'passable': BOOLEAN,
+                    'defenseBonus': INTEGER,
+                    'visibility': STRING,
+                    'backgroundColor': STRING,
+                    'backgroundImage': STRING,
+                    'symbol': STRING,
+                },
+                'additionalProperties': False,
+            },
+        },
+    },
+    'additionalProperties': False,
+}
+
+ABILITIES_SCHEMA = {
+    'type': 'object',
+    'required': ['abilities'],
+    'properties': {
+        'abilities': {
+            'type': 'object',
+            'additionalProperties': {
+                'type': 'object',
+                'required': ['name', 'category', 'description'],
+                'properties': {
+                    'name': STRING,
+                    'category': STRING,
+                    'description': STRING,
+                    'effect': STRING,
+                    'tags': STRING_LIST,
+                    'configurable': BOOLEAN,
+                    'parameters': {
+                        'type': 'object',
+                        'additionalProperties': {
+                            'type': 'object',
+                            'required': ['type', 'default'],
+                            'properties': {
+                                'type': {'enum': ['integer']},
+                                'min': INTEGER,
+                                'max': INTEGER,
+                                'default': INTEGER,
+                                'description': STRING,
+                            },
+                            'additionalProperties': False,
+                        },
+                    },
+                },
+                'additionalProperties': False,
+            },
+        },
+    },
+    'additionalProperties': False,
+}
+
+DIRECTIONS = {'type': 'array', 'items': {'enum': ['up', 'down', 'left', 'right']}}
+
+COMBAT_SCHEMA = {
+    'type': 'object',
+    'required': ['combatRules', 'movementRules'],
+    'properties': {
+        'combatRules': {
+            'type': 'object',
+            'required': ['rules', 'specialCases'],
+            'properties': {
+                'description': STRING,
+                'rules': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'object',
+                        'required': ['condition', 'result'],
+                        'properties': {'condition': STRING, 'result': STRING, 'description': STRING},
+                        'additionalProperties': False,
+                    },
+                },
+                'specialCases': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'object',
+                        'required': ['attacker', 'defender', 'result'],
+                        'properties': {
+                            'attacker': STRING,
+                            'defender': STRING,
+                            'result': STRING,
+                            'exception': STRING,
+                            'description': STRING,
+                        },
+                        'additionalProperties': False,
+                    },
+                },
+            },
+            'additionalProperties': False,
+        },
+        'movementRules': {
+            'type': 'object',
+            'additionalProperties': {
+                'type': 'object',
+                'properties': {
+                    'maxDistance': {'type': 'integer', 'minimum': 0},
+                    'directions': DIRECTIONS,
+                    'mustStop': STRING,
+                    'pieces': STRING_LIST,
+                },
+                'additionalProperties': False,
+            },
+        },
+        'gamePhases': {
+            'type': 'object',
+            'additionalProperties': {
+                'type': 'object',
+                'properties': {'description': STRING, 'actions': STRING_LIST},
+                'additionalProperties': False,
+            },
+        },
+    },
+    'additionalProperties': False,
+}
+
+
+# ---------------------------------------------------------------------------
+# Schema compiler
+# ---------------------------------------------------------------------------
+
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    'object': lambda v: isinstance(v, dict),
+    'array': lambda v: isinstance(v, list),
+    'string': lambda v: isinstance(v, str),
+    'integer': lambda v: isinstance(v, int) and not isinstance(v, bool),
+    'number': lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    'boolean': lambda v: isinstance(v, bool),
+    'null': lambda v: v is None,
+}
+
+
+def _key_path(path: str, key: str) -> str:
+    if key.isidentifier():
+        return f"{path}.{key}"
+    return f"{path}[{json.dumps(key)}]"
+
+
+def compile_schema(schema: Dict[str, Any]) -> Validator:
+    """Compile a schema into a single validator function.
+
+    All schema interpretation (type lookups, required/property tables, nested
+    compilation) happens here, once; the returned closure only runs the checks.
+    """
+    checks: List[Validator] = []
+
+    if 'anyOf' in schema:
+        options = [compile_schema(s) for s in schema['anyOf']]
+
+        def check_any_of(value, path, errors):
+            best: Optional[List[Tuple[str, str]]] = None
+            for option in options:
+                option_errors: List[Tuple[str, str]] = []
+                option(value, path, option_errors)
+                if not option_errors:
+                    return
+                if best is None or len(option_errors) < len(best):
+                    best = option_errors
+            errors.extend(best or [])
+        checks.append(check_any_of)
+
+    if 'enum' in schema:
+        allowed = list(schema['enum'])
+
+        def check_enum(value, path, errors):
+            if value not in allowed:
+                errors.append((path, f"expected one of {allowed}, got {value!r}"))
+        checks.append(check_enum)
+
+    type_names = schema.get('type')
+    if isinstance(type_names, str):
+        type_names = [type_names]
+    if type_names:
+        type_checks = tuple(_TYPE_CHECKS[t] for t in type_names)
+        expected = ' or '.join(type_names)
+
+        def check_type(value, path, errors):
+            if not any(check(value) for check in type_checks):
+                errors.append((path, f"expected {expected}, got {type(value).__name__}"))
+                return False
+            return True
+    else:
+        def check_type(value, path, errors):
+            return True
+
+    sub_checks: List[Validator] = []
+
+    if 'minimum' in schema:
+        minimum = schema['minimum']
+
+        def check_minimum(value, path, errors):
+            if _TYPE_CHECKS['number'](value) and value < minimum:
+                errors.append((path, f"must be >= {minimum}, got {value}"))
+        sub_checks.append(check_minimum)
+
+    if 'items' in schema:
+        item_validator = compile_schema(schema['items'])
+
+        def check_items(value, path, errors):
+            if isinstance(value, list):
+                for i, item in enumerate(value):
+                    item_validator(item, f"{path}[{i}]", errors)
+        sub_checks.append(check_items)
+
+    if 'required' in schema or 'properties' in schema or 'additionalProperties' in schema:
+        required = tuple(schema.get('required', ()))
+        properties = {k: compile_schema(s) for k, s in schema.get('properties', {}).items()}
+        additional = schema.get('additionalProperties', True)
+        additional_validator = compile_schema(additional) if isinstance(additional, dict) else None
+
+        def check_object(value, path, errors):
+            if not isinstance(value, dict):
+                return
+            for key in required:
+                if key not in value:
+                    errors.append((path, f"missing required property '{key}'"))
+            for key, item in value.items():
+                validator = properties.get(key)
+                if validator is not None:
+                    validator(item, _key_path(path, key), errors)
+                elif additional_validator is not None:
+                    additional_validator(item, _key_path(path, key), errors)
+                elif additional is False:
+                    errors.append((path, f"unexpected property '{key}'"))
+        sub_checks.append(check_object)
+
+    def validate(value, path, errors):
+        for check in checks:
+            check(value, path, errors)
+        if check_type(value, path, errors):
+            for check in sub_checks:
+                check(value, path, errors)
+
+    return validate
+
+
+# Compiled once at import time and shared by every file of the same kind.
+VALIDATORS: Dict[str, Validator] = {
+    'army': compile_schema(ARMY_SCHEMA),
+    'map': compile_schema(MAP_SCHEMA),
+    'terrain': compile_schema(TERRAIN_SCHEMA),
+    'abilities': compile_schema(ABILITIES_SCHEMA),
+    'combat': compile_schema(COMBAT_SCHEMA),
+}
+
+
+# ---------------------------------------------------------------------------
+# Loading and per-file validation
+# ---------------------------------------------------------------------------
+
+def collect_files(data_dir: str, combat_file: str) -> List[Tuple[str, str]]:
+    """Return (kind, path) pairs for every data file to validate."""
+    files: List[Tuple[str, str]] = []
+    files.extend(('army', p) for p in load_army_files(os.path.join(data_dir, 'armies')))
+
+    maps_dir = os.path.join(data_dir, 'maps')
+    if not os.path.isdir(maps_dir):
+        raise FileNotFoundError(f"Maps directory not found: {maps_dir}")
+    for entry in sorted(os.listdir(maps_dir)):
+        full = os.path.join(maps_dir, entry)
+        if entry.endswith('.json') and os.path.isfile(full):
+            files.append(('map', full))
+
+    files.append(('terrain', os.path.join(maps_dir, 'terrain', 'terrain.json')))
+    files.append(('abilities', os.path.join(data_dir, 'abilities', 'abilities.json')))
+    if combat_file:
+        files.append(('combat', combat_file))
+    return files
+
+
+def load_and_validate(kind: str, path: str) -> Tuple[str, str, Any, List[Tuple[str, str]]]:
+    """Load one file and run its compiled schema. Returns (kind, path, data, errors)."""
+    errors: List[Tuple[str, str]] = []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError, RecursionError) as e:
+        errors.append(('$', f"could not load: {e}"))
+        return kind, path, None, errors
+    VALIDATORS[kind](data, '$', errors)
+    return kind, path, data, errors
+
+
+# ---------------------------------------------------------------------------
+# Cross-file checks
+# ---------------------------------------------------------------------------
+
+def check_army_references(army: Any, abilities: Dict[str, Optional[Dict[str, Any]]]) -> List[Tuple[str, str]]:
+    errors: List[Tuple[str, str]] = []
+    if not isinstance(army, dict):
+        return errors
+    pieces = army.get('pieces')
+    if not isinstance(pieces, dict):
+        return errors
+
+    total = 0
+    for key, piece in pieces.items():
+        if not isinstance(piece, dict):
+            continue
+        piece_path = _key_path('$.pieces', key)
+        if piece.get('id') != key:
+            errors.append((f"{piece_path}.id", f"id {piece.get('id')!r} does not match key '{key}'"))
+        if isinstance(piece.get('count'), int):
+            total += piece['count']
+
+        refs = piece.get('abilities')
+        for i, ref in enumerate(refs if isinstance(refs, list) else []):
+            ref_path = f"{piece_path}.abilities[{i}]"
+            if isinstance(ref, str):
+                ability_id, params, id_path = ref, {}, ref_path
+            elif isinstance(ref, dict) and isinstance(ref.get('id'), str):
+                ability_id = ref['id']
+                params = {k: v for k, v in ref.items() if k != 'id'}
+                id_path = f"{ref_path}.id"
+            else:
+                continue
+            if ability_id not in abilities:
+                errors.append((id_path, f"unknown ability '{ability_id}'"))
+                continue
+            ability = abilities[ability_id]
+            if ability is None:
+                continue
+            declared = ability.get('parameters')
+            if not isinstance(declared, dict):
+                declared = {}
+            for name, value in params.items():
+                param_path = _key_path(ref_path, name)
+                spec = declared.get(name)
+                if spec is None:
+                    errors.append((param_path, f"ability '{ability_id}' has no parameter '{name}'"))
+                    continue
+                # Malformed specs are already reported by the abilities.json schema pass
+                if not isinstance(spec, dict) or not _TYPE_CHECKS['integer'](value):
+                    continue
+                minimum, maximum = spec.get('min'), spec.get('max')
+                if _TYPE_CHECKS['integer'](minimum) and value < minimum:
+                    errors.append((param_path, f"must be >= {minimum}, got {value}"))
+                if _TYPE_CHECKS['integer'](maximum) and value > maximum:
+                    errors.append((param_path, f"must be <= {maximum}, got {value}"))
+
+    if isinstance(army.get('totalPieces'), int) and army['totalPieces'] != total:
+        errors.append(('$.totalPieces', f"declares {army['totalPieces']} but piece counts sum to {total}"))
+    return errors
+
+
+def impassable_setup_tiles(map_data: Dict[str, Any], side: str, terrain_types: Dict[str, Optional[Dict[str, Any]]]) -> int:
+    """Mirror of gameLogic.countImpassableTerrainInSetupArea on the server.
+
+    Malformed parts of the map (already reported by the schema pass) are
+    skipped rather than trusted.
+    """
+    default = map_data.get('defaultTerrain')
+    if not isinstance(default, str):
+        default = None
+    overrides: Dict[Tuple[int, int], str] = {}
+    terrain_overrides = map_data.get('terrainOverrides')
+    if isinstance(terrain_overrides, dict):
+        for terrain_id, coords in terrain_overrides.items():
+            for coord in coords if isinstance(coords, list) else []:
+                if not isinstance(coord, dict):
+                    continue
+                x, y = coord.get('x'), coord.get('y')
+                if _TYPE_CHECKS['integer'](x) and _TYPE_CHECKS['integer'](y):
+                    overrides[(x, y)] = terrain_id
+    width = map_data['boardSize']['width']
+    rows = map_data['setupRows'].get(side)
+    count = 0
+    for row in rows if isinstance(rows, list) else []:
+        if not _TYPE_CHECKS['integer'](row):
+            continue
+        for col in range(width):
+            terrain = terrain_types.get(overrides.get((col, row), default))
+            if terrain and terrain.get('passable') is False:
+                count += 1
+    return count
+
+
+def check_map_references(map_data: Dict[str, Any], terrain_types: Dict[str, Any]) -> List[Tuple[str, str]]:
+    errors: List[Tuple[str, str]] = []
+    default = map_data.get('defaultTerrain')
+    if isinstance(default, str) and default not in terrain_types:
+        errors.append(('$.defaultTerrain', f"unknown terrain '{default}'"))
+
+    board = map_data.get('boardSize')
+    board = board if isinstance(board, dict) else {}
+    width, height = board.get('width'), board.get('height')
+    sized = _TYPE_CHECKS['integer'](width) and _TYPE_CHECKS['integer'](height)
+
+    overrides = map_data.get('terrainOverrides')
+    if isinstance(overrides, dict):
+        for terrain_id, coords in overrides.items():
+            override_path = _key_path('$.terrainOverrides', terrain_id)
+            if terrain_id not in terrain_types:
+                errors.append((override_path, f"unknown terrain '{terrain_id}'"))
+            if not sized or not isinstance(coords, list):
+                continue
+            for i, coord in enumerate(coords):
+                if not isinstance(coord, dict):
+                    continue
+                x, y = coord.get('x'), coord.get('y')
+                if (_TYPE_CHECKS['integer'](x) and _TYPE_CHECKS['integer'](y)
+                        and not (0 <= x < width and 0 <= y < height)):
+                    errors.append((f"{override_path}[{i}]", f"({x}, {y}) is outside the {width}x{height} board"))
+
+    setup_rows = map_data.get('setupRows')
+    if sized and isinstance(setup_rows, dict):
+        for side, rows in setup_rows.items():
+            for i, row in enumerate(rows if isinstance(rows, list) else []):
+                if _TYPE_CHECKS['integer'](row) and not 0 <= row < height:
+                    errors.append((f"$.setupRows.{side}[{i}]", f"row {row} is outside the board height {height}"))
+    return errors
+
+
+def check_army_fits_map(army: Dict[str, Any], map_data: Dict[str, Any], terrain_types: Dict[str, Any]) -> List[str]:
+    """Check the army's deployed piece count against the map on both sides.
+
+    Mirrors gameLogic.generateArmy: every scout piece type (matched by roster
+    key or class) has its own count reduced by the number of impassable tiles
+    in the setup area, floored at zero.
+    """
+    messages: List[str] = []
+    pieces = [(key, p) for key, p in army['pieces'].items()
+              if isinstance(p, dict) and _TYPE_CHECKS['integer'](p.get('count'))]
+    limit = map_data['numStartingPositions']
+    for side in ('home', 'away'):
+        impassable = impassable_setup_tiles(map_data, side, terrain_types)
+        deployed = 0
+        for key, piece in pieces:
+            count = piece['count']
+            if key == 'scout' or piece.get('class') == 'scout':
+                count = max(0, count - impassable)
+            deployed += count
+        if deployed > limit:
+            messages.append(f"{side} deploys {deployed} pieces but numStartingPositions is {limit}")
+    return messages
+
+
+def _is_valid_for_fit(map_data: Dict[str, Any]) -> bool:
+    """Whether the map is well-formed enough for a meaningful fit check.
+
+    Malformed maps already carry schema errors; running the fit check on them
+    would only add misleading deployment errors on top.
+    """
+    is_int = _TYPE_CHECKS['integer']
+    board = map_data.get('boardSize')
+    if not (isinstance(board, dict) and is_int(board.get('width'))):
+        return False
+    if not (isinstance(map_data.get('defaultTerrain'), str) and is_int(map_data.get('numStartingPositions'))):
+        return False
+    setup_rows = map_data.get('setupRows')
+    if not isinstance(setup_rows, dict):
+        return False
+    for side in ('home', 'away'):
+        rows = setup_rows.get(side)
+        if not (isinstance(rows, list) and all(is_int(row) for row in rows)):
+            return False
+    overrides = map_data.get('terrainOverrides', {})
+    if not isinstance(overrides, dict):
+        return False
+    for coords in overrides.values():
+        if not isinstance(coords, list):
+            return False
+        for coord in coords:
+            if not (isinstance(coord, dict) and is_int(coord.get('x')) and is_int(coord.get('y'))):
+                return False
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Driver
+# ---------------------------------------------------------------------------
+
+def validate_data(data_dir: str, combat_file: str, workers: Optional[int] = None) -> Dict[str, List[Tuple[str, str]]]:
+    """Validate the whole data tree. Returns {file_path: [(json_path, message), ...]}."""
+    files = collect_files(data_dir, combat_file)
+    # File reads overlap in the pool; the schema checks themselves are
+    # pure Python and effectively run one at a time under the GIL.
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(lambda item: load_and_validate(*item), files))
+    return check_references(results)
+
+
+def check_references(results: List[Tuple[str, str, Any, List[Tuple[str, str]]]]) -> Dict[str, List[Tuple[str, str]]]:
+    """Run the cross-file checks over load_and_validate results and build the report."""
+    report: Dict[str, List[Tuple[str, str]]] = {}
+    by_kind: Dict[str, List[Tuple[str, Any]]] = {}
+    for kind, path, data, errors in results:
+        report[path] = errors
+        if data is not None:
+            by_kind.setdefault(kind, []).append((path, data))
+
+    def section(kind: str, key: str) -> Dict[str, Optional[Dict[str, Any]]]:
+        # Non-dict entries are schema errors in their own file; keep their ids
+        # (mapped to None) so references to them are not reported again.
+        for _, data in by_kind.get(kind, []):
+            value = data.get(key) if isinstance(data, dict) else None
+            if isinstance(value, dict):
+                return {k: v if isinstance(v, dict) else None for k, v in value.items()}
+        return {}
+
+    abilities = section('abilities', 'abilities')
+    terrain_types = section('terrain', 'terrainTypes')
+
+    armies = []
+    for path, army in by_kind.get('army', []):
+        report[path].extend(check_army_references(army, abilities))
+        if isinstance(army, dict) and isinstance(army.get('pieces'), dict):
+            armies.append((path, army))
+
+    for path, map_data in by_kind.get('map', []):
+        if not isinstance(map_data, dict):
+            continue
+        report[path].extend(check_map_references(map_data, terrain_types))
+        if not _is_valid_for_fit(map_data):
+            continue
+        for army_path, army in armies:
+            army_name = army.get('id') or os.path.splitext(os.path.basename(army_path))[0]
+            for message in check_army_fits_map(army, map_data, terrain_types):
+                report[path].append(('$.numStartingPositions', f"army '{army_name}': {message}"))
+
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate Epoch Battles army, map, terrain, ability and combat data.")
+    parser.add_argument('--data-dir', default='client/public/data', help='Path to public data directory (default: client/public/data)')
+    parser.add_argument('--combat-file', default='server/src/data/combat.json', help='Combat rules file (default: server/src/data/combat.json)')
+    parser.add_argument('--workers', type=int, default=None, help='Number of loader threads (default: Python thread pool default)')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    report = validate_data(args.data_dir, args.combat_file, args.workers)
+    elapsed = time.perf_counter() - start
+
+    error_count = 0
+    for path in sorted(report):
+        display = os.path.relpath(path, args.data_dir) if path.startswith(args.data_dir) else path
+        for json_path, message in report[path]:
+            print(f"{display}: {json_path}: {message}")
+            error_count += 1
+
+    print(f"Validated {len(report)} files in {elapsed * 1000:.0f}ms: {error_count} error(s)")
+    if error_count:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()